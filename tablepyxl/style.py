@@ -1,6 +1,8 @@
 # This is where we handle translating css styles into openpyxl styles
 # and cascading those from parent to child in the dom.
 
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
 from openpyxl.cell import cell
 from openpyxl.styles import Font, Alignment, PatternFill, NamedStyle, Border, Side, Color
 from openpyxl.styles.fills import FILL_SOLID
@@ -89,6 +91,46 @@ def style_dict_to_named_style(style_dict, number_format=None):
     return known_styles[style_and_format_string]
 
 
+# The styles in known_styles are shared by every document, but openpyxl binds a NamedStyle to the
+# workbook it is added to. Each workbook gets its own copy instead, looked up here by style name.
+# Both levels are weak so that this lookup never keeps a finished workbook alive.
+workbook_styles = WeakKeyDictionary()
+
+
+def workbook_named_style(style, workbook):
+    """
+    Return the workbook's copy of a known style, adding it to the workbook the first time it is used.
+    """
+    styles = workbook_styles.get(workbook)
+    if styles is None:
+        styles = workbook_styles[workbook] = WeakValueDictionary()
+    named_style = styles.get(style.name)
+    if named_style is None:
+        named_style = NamedStyle(name=style.name, font=style.font, fill=style.fill, alignment=style.alignment,
+                                 border=style.border, number_format=style.number_format)
+        # A workbook loaded from a previous export already has its styles, reuse them when they match.
+        # workbook.named_styles only lists the names, the styles themselves are in the private _named_styles.
+        try:
+            existing = workbook._named_styles[style.name]
+        except KeyError:
+            existing = None
+        if existing is not None and style_contents(existing) == style_contents(named_style):
+            named_style = existing
+        else:
+            workbook.add_named_style(named_style)
+        styles[style.name] = named_style
+    return named_style
+
+
+def style_contents(named_style):
+    """
+    The parts of a NamedStyle that affect how a cell looks. Comparing whole NamedStyles
+    would also compare their position in the workbook (xfId), which differs for a reloaded style.
+    """
+    return (named_style.font, named_style.fill, named_style.alignment, named_style.border,
+            named_style.number_format, named_style.protection)
+
+
 class StyleDict(dict):
     """
     It's like a dictionary, but it looks for items in the parent dictionary
@@ -278,7 +320,7 @@ class TableCell(Element):
                 return '#,##0'
 
     def format(self, cell):
-        cell.style = self.style()
+        cell.style = workbook_named_style(self.style(), cell.parent.parent)
         data_type = self.data_type()
         if data_type:
             cell.data_type = data_type
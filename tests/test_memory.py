@@ -0,0 +1,123 @@
+import gc
+import os
+import tempfile
+import unittest
+import sys
+sys.path.append(".")
+
+try:
+    import tracemalloc
+except ImportError:  # python2
+    tracemalloc = None
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+
+from tablepyxl.tablepyxl import document_to_xl
+from tablepyxl.style import known_styles
+
+
+# The sizes can be raised to reproduce production sized exports, `tox -e memory`
+# converts 100000 rows and 1000 distinct styles. The ceilings below scale with them.
+ROWS = int(os.environ.get('TABLEPYXL_MEMORY_ROWS', 200))
+COLUMNS = 20
+DISTINCT_STYLES = int(os.environ.get('TABLEPYXL_MEMORY_STYLES', 100))
+
+# Ceilings are the larger of the values measured on CPython 3.7 and 3.11 with
+# openpyxl 2.6.2, plus a 25% margin.
+# Peak traced memory measured at ~1090 bytes per cell and ~8KB per style.
+PEAK_BYTES_PER_CELL = 1360
+PEAK_BYTES_PER_STYLE = 10 * 1024
+PEAK_BYTES_OVERHEAD = 1024 * 1024
+
+# Objects still alive after a conversion, measured at 16 per cached style
+# and 13 for a conversion that adds no new styles.
+RETAINED_OBJECTS_PER_STYLE = 20
+RETAINED_OBJECTS_OVERHEAD = 17
+
+
+def large_table(rows, columns):
+    row = "<tr>" + "".join("<td class='TYPE_INTEGER'>{}</td>".format(i) for i in range(columns)) + "</tr>"
+    return "<table name='large table'><tbody>" + row * rows + "</tbody></table>"
+
+
+def many_styles_table(styles):
+    rows = "".join("<tr><td style='color: #{:06x}'>{}</td></tr>".format(i, i) for i in range(styles))
+    return "<table name='styles table'><tbody>" + rows + "</tbody></table>"
+
+
+@unittest.skipUnless(tracemalloc, "tracemalloc is not available")
+class TestMemory(unittest.TestCase):
+    """
+    Memory regression tests for converting large documents
+    """
+
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.xlsx')
+        os.close(handle)
+        # Warm up so that lazily created module level state isn't counted against the conversions below
+        document_to_xl("<table><tr><td>warm up</td></tr></table>", self.filename)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def convert(self, doc, trace=True):
+        """
+        Converts doc with document_to_xl and returns the peak traced memory and
+        the number of objects that are still alive after the conversion.
+        The peak is None when trace is False, which skips the cost of tracing.
+        """
+        gc.collect()
+        objects_before = len(gc.get_objects())
+        peak = None
+        if trace:
+            tracemalloc.start()
+        try:
+            document_to_xl(doc, self.filename)
+            if trace:
+                _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if trace:
+                tracemalloc.stop()
+        gc.collect()
+        return peak, len(gc.get_objects()) - objects_before
+
+    def assertNoWorkbookAlive(self):
+        alive = [o for o in gc.get_objects() if isinstance(o, (Workbook, Cell))]
+        self.assertEqual(alive, [])
+
+    def test_large_table(self):
+        doc = large_table(ROWS, COLUMNS)
+        known_styles_length = len(known_styles)
+
+        peak, retained = self.convert(doc)
+
+        self.assertLess(peak, ROWS * COLUMNS * PEAK_BYTES_PER_CELL + PEAK_BYTES_OVERHEAD)
+        # Nothing from the workbook should outlive the conversion
+        self.assertLess(retained, RETAINED_OBJECTS_OVERHEAD)
+        self.assertNoWorkbookAlive()
+        # Every cell has the same style
+        self.assertLessEqual(len(known_styles), known_styles_length + 1)
+
+    def test_many_styles(self):
+        doc = many_styles_table(DISTINCT_STYLES)
+        known_styles_length = len(known_styles)
+
+        peak, retained = self.convert(doc)
+
+        self.assertLess(peak, DISTINCT_STYLES * PEAK_BYTES_PER_STYLE + PEAK_BYTES_OVERHEAD)
+        self.assertEqual(len(known_styles), known_styles_length + DISTINCT_STYLES)
+        # Only the cached styles should outlive the conversion
+        self.assertLess(retained, DISTINCT_STYLES * RETAINED_OBJECTS_PER_STYLE + RETAINED_OBJECTS_OVERHEAD)
+        self.assertNoWorkbookAlive()
+
+        # Converting the same styles again reuses the cache
+        _, retained = self.convert(doc, trace=False)
+
+        self.assertEqual(len(known_styles), known_styles_length + DISTINCT_STYLES)
+        self.assertLess(retained, RETAINED_OBJECTS_OVERHEAD)
+        self.assertNoWorkbookAlive()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
 import sys
+from io import BytesIO
 sys.path.append(".")
 
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, NamedStyle, Alignment, PatternFill
 from openpyxl.styles.fills import FILL_SOLID
 
@@ -75,6 +76,12 @@ table_whitespace = "<table name='whitespace table'>" \
                    "</tbody>" \
                    "</table>"
 
+table_styled = "<table name='styled table'>" \
+               "<tr>" \
+               "<td style='font-weight: bold'>Bold cell</td>" \
+               "</tr>" \
+               "</table>"
+
 table_comment = "<table name='comment table'>" \
                 "<tr>" \
                 "<td><!-- this is a html comment --></td>" \
@@ -125,6 +132,17 @@ class TestTablepyxl(unittest.TestCase):
         wb = document_to_workbook(table_three, wb=wb)
         self.assertEqual(wb.sheetnames, ['simple table', 'second table', 'Another simple table'])
 
+    def test_document_to_reloaded_workbook(self):
+        export = BytesIO()
+        document_to_workbook(table_styled).save(export)
+
+        # Styles already in a previous export are reused
+        wb = document_to_workbook(table_styled.replace('styled table', 'second styled table'),
+                                  wb=load_workbook(export))
+        self.assertEqual(wb.sheetnames, ['styled table', 'second styled table'])
+        self.assertTrue(wb['second styled table']['A1'].font.b)
+        self.assertEqual(wb['second styled table']['A1'].style, wb['styled table']['A1'].style)
+
     def test_comments(self):
         wb = document_to_workbook(table_comment)
         sheet = wb['comment table']